@@ -9,6 +9,7 @@ import curses
 import sys
 import logging
 import os
+import signal
 from typing import Optional
 
 from bw_tui.bitwarden import BitwardenCLI
@@ -31,7 +32,10 @@ class BwTuiApp:
                 format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                 filename='bw-tui.log'
             )
-        
+        else:
+            # Keep logging's last-resort stderr handler off the curses screen
+            logging.getLogger().addHandler(logging.NullHandler())
+
         self.logger = logging.getLogger(__name__)
     
     def run(self):
@@ -46,12 +50,19 @@ class BwTuiApp:
                 print("Please install it with: npm install -g @bitwarden/cli")
                 sys.exit(1)
             
-            # Check if user is logged in
+            # Check if user is logged in (the `bw status` result is cached
+            # and reused by the UI's unlock check)
             if not self.bw_cli.is_logged_in():
                 print("Error: You are not logged in to Bitwarden.")
                 print("Please run 'bw login' first.")
                 sys.exit(1)
             
+            # Exit through the normal clean-up path when killed or hung up,
+            # so the terminal is restored and `bw serve` is stopped
+            for name in ("SIGTERM", "SIGHUP"):
+                if hasattr(signal, name):
+                    signal.signal(getattr(signal, name), self._exit_on_signal)
+            
             # Initialize curses and run the UI
             curses.wrapper(self._run_ui)
             
@@ -59,6 +70,19 @@ class BwTuiApp:
             logger = logging.getLogger(__name__)
             logger.error("Application error: %s", e)
             raise
+        finally:
+            if self.bw_cli is not None:
+                self.bw_cli.close()
+    
+    def _exit_on_signal(self, signum, frame):
+        """Turn a termination signal into SystemExit.
+        
+        Args:
+            signum: The signal received
+            frame: The interrupted stack frame
+        """
+        self.logger.debug("Received signal %d, exiting", signum)
+        raise SystemExit(128 + signum)
     
     def _run_ui(self, stdscr):
         """Run the curses UI.
@@ -5,13 +5,107 @@ This module provides a Python interface to the Bitwarden CLI,
 handling authentication, vault operations, and data parsing.
 """
 
+import atexit
+import functools
 import json
 import subprocess
 import shutil
 import logging
+import mmap
 import os
+import socket
 import time
-from typing import List, Dict, Any, Optional, Tuple
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import List, Dict, Any, Generator, Iterator, Optional, Tuple, Union
+
+try:
+    import msgspec
+except ImportError:  # Optional: fastest JSON parsing, orjson/stdlib json are the fallback
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing, stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: incremental parsing of `bw list items`
+    ijson = None
+
+
+_msgspec_decoder = msgspec.json.Decoder() if msgspec is not None else None
+
+
+def _json_loads(data: Union[bytes, memoryview]) -> Any:
+    """Parse a JSON document from raw bytes using the fastest available parser."""
+    if _msgspec_decoder is not None:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            # Keep a single exception type for callers, whichever parser is used
+            raise json.JSONDecodeError(str(e), "", 0) from e
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Descriptors opened by Python are non-inheritable (PEP 446), so children do
+# not need close_fds. Leaving it off lets CPython start them with
+# posix_spawn() instead of fork()+exec(), which is cheaper once the process
+# holds a large vault in memory.
+_CLOSE_FDS = False
+
+# Common locations for bw when installed via npm
+_BW_COMMON_PATHS = (
+    "/Users/orangemax/.nvm/versions/node/v23.6.0/bin/bw",
+    "/usr/local/bin/bw",
+    "/opt/homebrew/bin/bw",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_bw_path(common_paths: Tuple[str, ...]) -> str:
+    """Find the path to the bw command.
+    
+    The lookup is done once per process and shared by all instances.
+    
+    Args:
+        common_paths: Locations to try when bw is not on PATH
+        
+    Returns:
+        Path to bw command, or 'bw' if not found in specific locations
+    """
+    # First try shutil.which
+    bw_path = shutil.which("bw")
+    if bw_path:
+        return bw_path
+    
+    # Then try common paths
+    for path in common_paths:
+        if os.path.exists(path):
+            return path
+    
+    # Fallback to 'bw' and hope it's in PATH
+    return "bw"
+
+
+def _find_free_port(host: str) -> int:
+    """Ask the OS for a currently unused TCP port on host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
 
 
 class BitwardenCLI:
@@ -19,61 +113,107 @@ class BitwardenCLI:
     
     SESSION_FILE = os.path.expanduser("~/.bw-tui-session.json")
     SESSION_TIMEOUT = 10 * 60  # 10 minutes in seconds
+    SERVE_HOST = "127.0.0.1"  # Never expose the unlocked vault beyond localhost
+    SERVE_STARTUP_TIMEOUT = 30.0  # Seconds to wait for `bw serve` to accept requests
+    SERVE_REQUEST_TIMEOUT = 30.0
+    ITEM_CACHE_TTL = 30.0  # Seconds a fetched item is reused by get_item
+    STATUS_VALUES = (b"unlocked", b"locked", b"unauthenticated")
+    
+    # (mtime, session key) of the session file last read or written by any instance
+    _SESSION_CACHE: Optional[Tuple[float, str]] = None
     
     def __init__(self):
         """Initialize the Bitwarden CLI wrapper."""
         self.logger = logging.getLogger(__name__)
-        self.bw_path = self._find_bw_path()
+        self.bw_path = _find_bw_path(_BW_COMMON_PATHS)
+        self._cli_available: Optional[bool] = None
+        self._base_env = dict(os.environ)
         self._session_key: Optional[str] = None
+        self._status_cache: Optional[Tuple[float, Optional[str]]] = None
+        self._item_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._search_index: Optional[List[Tuple[Dict[str, Any], str]]] = None
+        self._sync_proc: Optional[subprocess.Popen] = None
+        self._serve_proc: Optional[subprocess.Popen] = None
+        self._serve_session: Optional[str] = None
+        # `bw serve` answers anyone on localhost with the decrypted vault,
+        # so it is only used when explicitly asked for
+        self._serve_enabled = os.environ.get('BW_TUI_SERVE', '0') == '1'
+        self._serve_failed = False
+        self._base_url: Optional[str] = None
+        if self._serve_enabled:
+            atexit.register(self.close)  # Also stop the daemon when the app exits some other way
         self._load_session()
     
-    def _find_bw_path(self) -> str:
-        """Find the path to the bw command.
+    def __del__(self):
+        if getattr(self, "_serve_proc", None) is not None:
+            self.close()
+    
+    def close(self) -> None:
+        """Release background resources such as the `bw serve` daemon."""
+        self._stop_sync()
+        self._stop_serve()
+    
+    def _stop_sync(self) -> None:
+        """Terminate a running `bw sync`, if any."""
+        proc = self._sync_proc
+        self._sync_proc = None
+        if proc is not None and proc.poll() is None:
+            self.logger.debug("Stopping bw sync")
+            proc.terminate()
+    
+    def _session_env(self, session_key: Optional[str]) -> Optional[Dict[str, str]]:
+        """Build the environment for a `bw` call.
         
+        Args:
+            session_key: Session key to pass as BW_SESSION, if any
+            
         Returns:
-            Path to bw command, or 'bw' if not found in specific locations
+            Environment mapping, or None to let the child inherit ours as-is
         """
-        # Common locations for bw when installed via npm
-        common_paths = [
-            "/Users/orangemax/.nvm/versions/node/v23.6.0/bin/bw",
-            "/usr/local/bin/bw",
-            "/opt/homebrew/bin/bw"
-        ]
-        
-        # First try shutil.which
-        bw_path = shutil.which("bw")
-        if bw_path:
-            return bw_path
-        
-        # Then try common paths
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        # Fallback to 'bw' and hope it's in PATH
-        return "bw"
+        if not session_key:
+            return None
+        return {**self._base_env, "BW_SESSION": session_key}
     
     def _load_session(self) -> None:
         """Load session from file if it exists and is valid."""
         try:
-            if os.path.exists(self.SESSION_FILE):
-                with open(self.SESSION_FILE, 'r', encoding='utf-8') as f:
-                    session_data = json.load(f)
-                
-                session_key = session_data.get('session_key')
-                timestamp = session_data.get('timestamp', 0)
-                
-                # Check if session is still valid (less than 10 minutes old)
-                current_time = time.time()
-                if current_time - timestamp < self.SESSION_TIMEOUT and session_key:
-                    self._session_key = session_key
-                    self.logger.debug("Loaded valid session from file")
-                else:
-                    self.logger.debug("Session expired or invalid, will require login")
-                    self._cleanup_session_file()
-            else:
+            try:
+                st = os.stat(self.SESSION_FILE)
+            except FileNotFoundError:
                 self.logger.debug("No session file found")
-        except (json.JSONDecodeError, KeyError, OSError) as e:
+                return
+            
+            # The file is rewritten on every save, so its mtime rules out
+            # expired sessions without opening it
+            current_time = time.time()
+            if current_time - st.st_mtime >= self.SESSION_TIMEOUT:
+                self.logger.debug("Session expired or invalid, will require login")
+                self._cleanup_session_file()
+                return
+            
+            cached = BitwardenCLI._SESSION_CACHE
+            if cached is not None and cached[0] == st.st_mtime:
+                self._session_key = cached[1]
+                self.logger.debug("Reused session loaded earlier in this process")
+                return
+            
+            with open(self.SESSION_FILE, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        session_data = _json_loads(view)
+            
+            session_key = session_data.get('session_key')
+            timestamp = session_data.get('timestamp', 0)
+            
+            # Check if session is still valid (less than 10 minutes old)
+            if current_time - timestamp < self.SESSION_TIMEOUT and session_key:
+                self._session_key = session_key
+                BitwardenCLI._SESSION_CACHE = (st.st_mtime, session_key)
+                self.logger.debug("Loaded valid session from file")
+            else:
+                self.logger.debug("Session expired or invalid, will require login")
+                self._cleanup_session_file()
+        except (json.JSONDecodeError, KeyError, OSError, ValueError) as e:
             self.logger.warning("Failed to load session file: %s", e)
             self._cleanup_session_file()
     
@@ -88,16 +228,18 @@ class BitwardenCLI:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.SESSION_FILE), exist_ok=True)
             
-            with open(self.SESSION_FILE, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2)
+            with open(self.SESSION_FILE, 'wb') as f:
+                f.write(_json_dumps(session_data))
             
             self._session_key = session_key
+            BitwardenCLI._SESSION_CACHE = (os.stat(self.SESSION_FILE).st_mtime, session_key)
             self.logger.debug("Session saved to file")
         except OSError as e:
             self.logger.warning("Failed to save session file: %s", e)
     
     def _cleanup_session_file(self) -> None:
         """Remove the session file."""
+        BitwardenCLI._SESSION_CACHE = None
         try:
             if os.path.exists(self.SESSION_FILE):
                 os.remove(self.SESSION_FILE)
@@ -111,9 +253,132 @@ class BitwardenCLI:
     
     def clear_session(self) -> None:
         """Clear the current session."""
+        self._stop_sync()
         self._session_key = None
+        self._invalidate_status()
+        self._item_cache.clear()
+        self._search_index = None
+        self._stop_serve()
         self._cleanup_session_file()
     
+    def _ensure_serve(self, session_key: str) -> Optional[str]:
+        """Start a `bw serve` daemon for the session if one is not running.
+        
+        A single long-lived daemon answers all vault reads over localhost
+        HTTP, so each read no longer pays the CLI start-up cost. The
+        daemon is stopped by close(), which also runs at interpreter exit;
+        a bw-tui killed with SIGKILL leaves it running.
+        
+        Args:
+            session_key: Session key the daemon should use
+            
+        Returns:
+            Base URL of the daemon, or None if it could not be started
+        """
+        proc = self._serve_proc
+        if proc is not None and proc.poll() is None and self._serve_session == session_key:
+            return self._base_url
+        
+        self._stop_serve()
+        if self._serve_failed:
+            return None
+        
+        try:
+            port = _find_free_port(self.SERVE_HOST)
+            env = self._session_env(session_key)
+            self.logger.debug("Starting %s serve on port %d", self.bw_path, port)
+            proc = subprocess.Popen(
+                [self.bw_path, "serve", "--hostname", self.SERVE_HOST, "--port", str(port)],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+                close_fds=_CLOSE_FDS
+            )
+        except OSError as e:
+            self.logger.warning("Failed to start bw serve: %s", e)
+            self._serve_failed = True
+            return None
+        
+        base_url = "http://%s:%d" % (self.SERVE_HOST, port)
+        deadline = time.monotonic() + self.SERVE_STARTUP_TIMEOUT
+        while proc.poll() is None and time.monotonic() < deadline:
+            try:
+                with urllib.request.urlopen(base_url + "/status", timeout=1):
+                    break
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.1)
+        else:
+            self.logger.warning("bw serve did not become ready, falling back to CLI calls")
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+            self._serve_failed = True
+            return None
+        
+        self._serve_proc = proc
+        self._serve_session = session_key
+        self._base_url = base_url
+        self.logger.debug("bw serve ready at %s", base_url)
+        return base_url
+    
+    def _stop_serve(self) -> None:
+        """Shut down the `bw serve` daemon if it is running."""
+        proc = self._serve_proc
+        self._serve_proc = None
+        self._serve_session = None
+        self._base_url = None
+        if proc is not None and proc.poll() is None:
+            self.logger.debug("Stopping bw serve")
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+    
+    def _serve_request(self, path: str, session_key: Optional[str],
+                       params: Optional[Dict[str, str]] = None,
+                       method: str = "GET") -> Optional[Dict[str, Any]]:
+        """Send a request to the `bw serve` daemon.
+        
+        Args:
+            path: API path, e.g. "/list/object/items"
+            session_key: Session key for authentication
+            params: Optional query parameters
+            method: HTTP method
+            
+        Returns:
+            The decoded response envelope, or None if the daemon is disabled or unavailable
+        """
+        if not session_key or not self._serve_enabled:
+            return None
+        base_url = self._ensure_serve(session_key)
+        if base_url is None:
+            return None
+        
+        url = base_url + path
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        data = b"" if method == "POST" else None
+        request = urllib.request.Request(url, data=data, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=self.SERVE_REQUEST_TIMEOUT) as response:
+                body = response.read()
+        except urllib.error.HTTPError as e:
+            # Failed requests still carry a JSON envelope with the error message
+            body = e.read()
+        except (urllib.error.URLError, OSError) as e:
+            self.logger.warning("bw serve request failed: %s", e)
+            self._stop_serve()
+            return None
+        
+        try:
+            return _json_loads(body)
+        except json.JSONDecodeError as e:
+            self.logger.error("Failed to parse bw serve response: %s", e)
+            return None
+    
     def lock_vault(self) -> bool:
         """Lock the vault and clear the session.
         
@@ -125,9 +390,8 @@ class BitwardenCLI:
             result = subprocess.run(
                 [self.bw_path, "lock"],
                 capture_output=True,
-                text=True,
                 check=True,
-                env=os.environ.copy()
+                close_fds=_CLOSE_FDS
             )
             self.logger.debug("Vault locked successfully")
             
@@ -152,7 +416,63 @@ class BitwardenCLI:
         Returns:
             True if the CLI is available, False otherwise
         """
-        return os.path.exists(self.bw_path) if self.bw_path != "bw" else shutil.which("bw") is not None
+        if self._cli_available is None:
+            if self.bw_path != "bw":
+                self._cli_available = os.path.exists(self.bw_path)
+            else:
+                self._cli_available = shutil.which("bw") is not None
+        return self._cli_available
+    
+    def _parse_status(self, stdout: bytes) -> Optional[str]:
+        """Extract the vault status from the output of `bw status`.
+        
+        The raw output is scanned for the known status values first; the
+        JSON is only parsed when that scan is ambiguous.
+        
+        Args:
+            stdout: Raw output of `bw status`
+            
+        Returns:
+            The status value, e.g. "unlocked", "locked" or "unauthenticated"
+        """
+        matches = [value for value in self.STATUS_VALUES if b'"%s"' % value in stdout]
+        if len(matches) == 1:
+            return matches[0].decode('ascii')
+        return _json_loads(stdout).get("status")
+    
+    def _get_status(self, max_age: float = 2.0) -> Optional[str]:
+        """Get the vault status reported by `bw status`, reusing a recent result.
+        
+        Args:
+            max_age: Maximum age in seconds of a cached status to reuse
+            
+        Returns:
+            The status value if the command succeeded, None otherwise
+        """
+        if self._status_cache is not None:
+            timestamp, status = self._status_cache
+            if time.monotonic() - timestamp < max_age:
+                self.logger.debug("Using cached status")
+                return status
+        
+        try:
+            self.logger.debug("Checking status with command: %s status", self.bw_path)
+            result = subprocess.run(
+                [self.bw_path, "status"],
+                capture_output=True,
+                check=True,
+                close_fds=_CLOSE_FDS
+            )
+            status = self._parse_status(result.stdout)
+            self._status_cache = (time.monotonic(), status)
+            return status
+        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            self.logger.error("Error checking status: %s", e)
+            return None
+    
+    def _invalidate_status(self) -> None:
+        """Forget the cached `bw status` result."""
+        self._status_cache = None
     
     def is_logged_in(self) -> bool:
         """Check if the user is logged in to Bitwarden.
@@ -160,24 +480,39 @@ class BitwardenCLI:
         Returns:
             True if logged in, False otherwise
         """
+        status = self._get_status()
+        self.logger.debug("Login status: %s", status)
+        logged_in = status in ["unlocked", "locked"]
+        self.logger.debug("Is logged in: %s", logged_in)
+        return logged_in
+    
+    def _check_locked_after_failure(self, session_key: Optional[str]) -> None:
+        """Drop the session if a failed vault read was caused by a locked vault.
+        
+        A saved session stops working when the vault is locked elsewhere,
+        e.g. by `bw lock` in another terminal. Once it is dropped,
+        is_unlocked reports the vault as locked again.
+        
+        Args:
+            session_key: Session key the failed read used
+        """
         try:
-            self.logger.debug(f"Checking login status with command: {self.bw_path} status")
             result = subprocess.run(
                 [self.bw_path, "status"],
+                env=self._session_env(session_key),
                 capture_output=True,
-                text=True,
                 check=True,
-                env=os.environ.copy()  # Use full environment
+                close_fds=_CLOSE_FDS
             )
-            status_data = json.loads(result.stdout)
-            status = status_data.get("status")
-            self.logger.debug(f"Login status: {status}")
-            logged_in = status in ["unlocked", "locked"]
-            self.logger.debug(f"Is logged in: {logged_in}")
-            return logged_in
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-            self.logger.error(f"Error checking login status: {e}")
-            return False
+            status = self._parse_status(result.stdout)
+        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            self.logger.error("Error checking status: %s", e)
+            return
+        
+        if status != "unlocked":
+            self.logger.debug("Vault is %s, dropping the session", status)
+            self.clear_session()
+        self._status_cache = (time.monotonic(), status)
     
     def is_unlocked(self) -> bool:
         """Check if the vault is unlocked.
@@ -191,24 +526,11 @@ class BitwardenCLI:
             return True
         
         # Fall back to checking CLI status
-        try:
-            self.logger.debug("Checking unlock status with command: %s status", self.bw_path)
-            result = subprocess.run(
-                [self.bw_path, "status"],
-                capture_output=True,
-                text=True,
-                check=True,
-                env=os.environ.copy()  # Use full environment
-            )
-            status_data = json.loads(result.stdout)
-            status = status_data.get("status")
-            self.logger.debug("Vault status: %s", status)
-            unlocked = status == "unlocked"
-            self.logger.debug("Is unlocked: %s", unlocked)
-            return unlocked
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
-            self.logger.error("Error checking unlock status: %s", e)
-            return False
+        status = self._get_status()
+        self.logger.debug("Vault status: %s", status)
+        unlocked = status == "unlocked"
+        self.logger.debug("Is unlocked: %s", unlocked)
+        return unlocked
     
     def unlock(self, password: str) -> Optional[str]:
         """Unlock the vault with the master password.
@@ -224,11 +546,12 @@ class BitwardenCLI:
             result = subprocess.run(
                 [self.bw_path, "unlock", password, "--raw"],
                 capture_output=True,
-                text=True,
                 check=True,
-                env=os.environ.copy()  # Use full environment
+                close_fds=_CLOSE_FDS
             )
-            session_key = result.stdout.strip()
+            session_key = result.stdout.strip().decode('ascii')
+            self._invalidate_status()
+            self._search_index = None
             self.logger.debug("Unlock successful, session key length: %d", len(session_key) if session_key else 0)
             
             # Save the session for future use
@@ -253,9 +576,8 @@ class BitwardenCLI:
             subprocess.run(
                 [self.bw_path, "lock"],
                 capture_output=True,
-                text=True,
                 check=True,
-                env=os.environ.copy()  # Use full environment
+                close_fds=_CLOSE_FDS
             )
             self.logger.debug("Vault locked successfully")
             
@@ -272,22 +594,41 @@ class BitwardenCLI:
     def sync(self, session_key: Optional[str] = None) -> bool:
         """Sync the vault with the server.
         
+        A sync still running when close() or clear_session() is called is
+        terminated and reported as failed.
+        
         Args:
-            session_key: Optional session key for authentication
+            session_key: Optional session key for authentication (uses stored session if None)
             
         Returns:
             True if sync was successful, False otherwise
         """
-        try:
+        # Use provided session key or stored session key
+        effective_session_key = session_key or self._session_key
+        
+        response = self._serve_request("/sync", effective_session_key, method="POST")
+        if response is not None:
+            synced = bool(response.get("success"))
+        else:
             cmd = [self.bw_path, "sync"]
-            env = os.environ.copy()  # Copy current environment
-            if session_key:
-                env["BW_SESSION"] = session_key
+            env = self._session_env(effective_session_key)
             
-            subprocess.run(cmd, env=env, check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            # Kept so close() and clear_session() can stop a sync in progress
+            proc = subprocess.Popen(
+                cmd,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=_CLOSE_FDS
+            )
+            self._sync_proc = proc
+            synced = proc.wait() == 0
+            self._sync_proc = None
+        
+        if synced:
+            self._item_cache.clear()
+            self._search_index = None
+        return synced
     
     def get_items(self, session_key: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all items from the vault.
@@ -298,37 +639,84 @@ class BitwardenCLI:
         Returns:
             List of vault items
         """
-        try:
-            cmd = [self.bw_path, "list", "items"]
-            env = os.environ.copy()  # Copy current environment
-            
-            # Use provided session key or stored session key
-            effective_session_key = session_key or self._session_key
-            
-            if effective_session_key:
-                env["BW_SESSION"] = effective_session_key
-                self.logger.debug("Getting items with session key (length: %d)", len(effective_session_key))
-            else:
-                self.logger.debug("Getting items without session key")
+        items = list(self.iter_items(session_key))
+        
+        # Log first few item names for debugging
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i, item in enumerate(items[:3]):
+                name = item.get("name", "Unknown")
+                self.logger.debug("Item %d: %s", i+1, name)
+        
+        self._build_search_index(items)
+        return items
+    
+    def _build_search_index(self, items: List[Dict[str, Any]]) -> None:
+        """Precompute lowercase search text for each item.
+        
+        Args:
+            items: Vault items as returned by get_items
+        """
+        index = []
+        for item in items:
+            name = item.get("name") or ""
+            username = (item.get("login") or {}).get("username") or ""
+            index.append((item, (name + "\n" + username).lower()))
+        self._search_index = index
+    
+    def iter_items(self, session_key: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all items in the vault.
+        
+        When ijson is installed and items come from the CLI, the output of
+        `bw list items` is parsed while it is being read, so callers get the
+        first items before the whole vault has been transferred.
+        
+        Args:
+            session_key: Optional session key for authentication (uses stored session if None)
             
+        Yields:
+            Vault items
+        """
+        # Use provided session key or stored session key
+        effective_session_key = session_key or self._session_key
+        
+        response = self._serve_request("/list/object/items", effective_session_key)
+        if response is not None:
+            if not response.get("success"):
+                self.logger.error("Failed to get items: %s", response.get("message"))
+                self._check_locked_after_failure(effective_session_key)
+                return
+            items = response["data"]["data"]
+            self.logger.debug("Successfully retrieved %d items via bw serve", len(items))
+            yield from items
+            return
+        
+        cmd = [self.bw_path, "list", "items"]
+        env = self._session_env(effective_session_key)
+        
+        if effective_session_key:
+            self.logger.debug("Getting items with session key (length: %d)", len(effective_session_key))
+        else:
+            self.logger.debug("Getting items without session key")
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug("Running command: %s", ' '.join(cmd))
+        if ijson is not None:
+            if not (yield from self._stream_items(cmd, env)):
+                self._check_locked_after_failure(effective_session_key)
+            return
+        
+        try:
             result = subprocess.run(
                 cmd,
                 env=env,
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                close_fds=_CLOSE_FDS
             )
             
-            items = json.loads(result.stdout)
+            items = _json_loads(result.stdout)
             self.logger.debug("Successfully retrieved %d items from vault", len(items))
-            
-            # Log first few item names for debugging
-            for i, item in enumerate(items[:3]):
-                name = item.get("name", "Unknown")
-                self.logger.debug("Item %d: %s", i+1, name)
-            
-            return items
+            yield from items
         except subprocess.CalledProcessError as e:
             # If command fails, it might be because vault is locked
             self.logger.error("Failed to get items: %s", e)
@@ -336,14 +724,64 @@ class BitwardenCLI:
                 self.logger.error("Error output: %s", e.stderr)
             if hasattr(e, 'stdout') and e.stdout:
                 self.logger.debug("Command output: %s", e.stdout)
-            return []
+            self._check_locked_after_failure(effective_session_key)
         except json.JSONDecodeError as e:
             self.logger.error("Failed to parse JSON response: %s", e)
-            return []
+    
+    def _stream_items(self, cmd: List[str], env: Optional[Dict[str, str]]) -> Generator[Dict[str, Any], None, bool]:
+        """Run an item listing command and parse its JSON array incrementally.
+        
+        Args:
+            cmd: Command to run
+            env: Environment for the command
+            
+        Yields:
+            Vault items, as soon as each one has been parsed
+            
+        Returns:
+            False if the command failed, True otherwise
+        """
+        count = 0
+        parse_error = None
+        proc = subprocess.Popen(
+            cmd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=_CLOSE_FDS
+        )
+        try:
+            for item in ijson.items(proc.stdout, 'item', use_float=True):
+                count += 1
+                yield item
+        except ijson.JSONError as e:
+            parse_error = e
+        finally:
+            proc.stdout.close()
+            stderr = proc.stderr.read()
+            proc.stderr.close()
+            returncode = proc.wait()
+        
+        if returncode != 0:
+            # If command fails, it might be because vault is locked
+            self.logger.error("Failed to get items: %s",
+                              subprocess.CalledProcessError(returncode, cmd))
+            if stderr:
+                self.logger.error("Error output: %s", stderr)
+            return False
+        if parse_error is not None:
+            self.logger.error("Failed to parse JSON response: %s", parse_error)
+        else:
+            self.logger.debug("Successfully retrieved %d items from vault", count)
+        return True
     
     def search_items(self, query: str, session_key: Optional[str] = None) -> List[Dict[str, Any]]:
         """Search for items in the vault.
         
+        Once get_items has loaded the vault, queries are answered locally
+        by case-insensitive substring match on item name and username.
+        Before that, the search is delegated to `bw list items --search`.
+        
         Args:
             query: Search query
             session_key: Optional session key for authentication (uses stored session if None)
@@ -351,24 +789,29 @@ class BitwardenCLI:
         Returns:
             List of matching vault items
         """
+        if self._search_index is not None:
+            query_lower = query.lower()
+            return [item for item, haystack in self._search_index if query_lower in haystack]
+        
+        # Use provided session key or stored session key
+        effective_session_key = session_key or self._session_key
+        
+        response = self._serve_request("/list/object/items", effective_session_key, {"search": query})
+        if response is not None:
+            return response["data"]["data"] if response.get("success") else []
+        
         try:
             cmd = [self.bw_path, "list", "items", "--search", query]
-            env = os.environ.copy()  # Copy current environment
-            
-            # Use provided session key or stored session key
-            effective_session_key = session_key or self._session_key
-            
-            if effective_session_key:
-                env["BW_SESSION"] = effective_session_key
+            env = self._session_env(effective_session_key)
             
             result = subprocess.run(
                 cmd,
                 env=env,
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                close_fds=_CLOSE_FDS
             )
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             return []
     
@@ -382,23 +825,37 @@ class BitwardenCLI:
         Returns:
             Item data if found, None otherwise
         """
+        cached = self._item_cache.get(item_id)
+        if cached is not None and time.monotonic() - cached[0] < self.ITEM_CACHE_TTL:
+            self.logger.debug("Using cached item %s", item_id)
+            return cached[1]
+        
+        item = self._fetch_item(item_id, session_key)
+        if item is not None:
+            self._item_cache[item_id] = (time.monotonic(), item)
+        return item
+    
+    def _fetch_item(self, item_id: str, session_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Fetch a specific item by ID from `bw`, bypassing the item cache."""
+        # Use provided session key or stored session key
+        effective_session_key = session_key or self._session_key
+        
+        path = "/object/item/" + urllib.parse.quote(item_id, safe="")
+        response = self._serve_request(path, effective_session_key)
+        if response is not None:
+            return response["data"] if response.get("success") else None
+        
         try:
             cmd = [self.bw_path, "get", "item", item_id]
-            env = os.environ.copy()  # Copy current environment
-            
-            # Use provided session key or stored session key
-            effective_session_key = session_key or self._session_key
-            
-            if effective_session_key:
-                env["BW_SESSION"] = effective_session_key
+            env = self._session_env(effective_session_key)
             
             result = subprocess.run(
                 cmd,
                 env=env,
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                close_fds=_CLOSE_FDS
             )
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
         except (subprocess.CalledProcessError, json.JSONDecodeError):
             return None
\ No newline at end of file
@@ -9,112 +9,175 @@ import curses
 import pyperclip
 import logging
 import time
+import shutil
 import subprocess
-from typing import List, Dict, Any
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple
 
 from bw_tui.bitwarden import BitwardenCLI
 
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized search of large vaults
+    np = None
+
 
 class ClipboardManager:
     """Cross-platform clipboard manager with multiple fallback methods."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        
+        # Let pyperclip pick its backend now rather than on the first copy,
+        # and skip it entirely if it found none
+        self._pyperclip_copy, _ = pyperclip.determine_clipboard()
+        
+        self.methods = [self._try_pyperclip] if self._pyperclip_copy else []
+        
+        # Only offer the command-line tools that are actually installed
+        tools = [
+            ("xclip", self._try_xclip),
+            ("xsel", self._try_xsel),
+            ("wl-copy", self._try_wl_copy),
+            ("termux-clipboard-set", self._try_termux_clipboard),
+        ]
+        self.methods += [method for tool, method in tools if shutil.which(tool)]
+        self._working_method = None  # Method of the last successful copy
     
     def copy_to_clipboard(self, text: str) -> bool:
         """Copy text to clipboard using the best available method.
         
+        The method that worked last time is tried first, the others only
+        if it fails.
+        
         Returns:
             True if successful, False otherwise
         """
-        methods = [
-            self._try_pyperclip,
-            self._try_xclip,
-            self._try_xsel,
-            self._try_wl_copy,
-            self._try_termux_clipboard,
-        ]
+        failed = self._working_method
+        if failed is not None:
+            if self._try_method(failed, text):
+                return True
+            self._working_method = None
         
-        for method in methods:
-            try:
-                if method(text):
-                    self.logger.debug("Successfully copied to clipboard using %s", method.__name__)
-                    return True
-            except (OSError, subprocess.SubprocessError, ValueError) as e:
-                self.logger.debug("Clipboard method %s failed: %s", method.__name__, e)
-                continue
+        for method in self.methods:
+            if method != failed and self._try_method(method, text):
+                self._working_method = method
+                return True
         
         self.logger.warning("All clipboard methods failed")
         return False
     
+    def _try_method(self, method: Callable[[str], bool], text: str) -> bool:
+        """Copy text with a single clipboard method.
+        
+        Args:
+            method: One of the _try_* methods
+            text: Text to copy
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if method(text):
+                self.logger.debug("Successfully copied to clipboard using %s", method.__name__)
+                return True
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            self.logger.debug("Clipboard method %s failed: %s", method.__name__, e)
+        return False
+    
     def _try_pyperclip(self, text: str) -> bool:
         """Try using pyperclip."""
         try:
-            pyperclip.copy(text)
+            self._pyperclip_copy(text)
             return True
         except (OSError, pyperclip.PyperclipException):
             return False
     
-    def _try_xclip(self, text: str) -> bool:
-        """Try using xclip (X11 clipboard)."""
+    def _pipe_to(self, command: List[str], text: str) -> bool:
+        """Copy text by writing it to a clipboard tool's stdin.
+        
+        xclip and xsel fork a process that keeps serving the selection
+        with the inherited stdout and stderr. Those are discarded rather
+        than captured, because capturing them would wait on that process
+        until some other program takes the selection.
+        
+        Args:
+            command: Clipboard tool and its arguments
+            text: Text to copy
+            
+        Returns:
+            True if successful, False otherwise
+        """
         try:
             process = subprocess.run(
-                ['xclip', '-selection', 'clipboard'],
+                command,
                 input=text,
                 text=True,
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             return process.returncode == 0
         except (subprocess.CalledProcessError, FileNotFoundError):
             return False
     
+    def _try_xclip(self, text: str) -> bool:
+        """Try using xclip (X11 clipboard)."""
+        return self._pipe_to(['xclip', '-selection', 'clipboard'], text)
+    
     def _try_xsel(self, text: str) -> bool:
         """Try using xsel (X11 clipboard)."""
-        try:
-            process = subprocess.run(
-                ['xsel', '--clipboard', '--input'],
-                input=text,
-                text=True,
-                check=True,
-                capture_output=True
-            )
-            return process.returncode == 0
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return self._pipe_to(['xsel', '--clipboard', '--input'], text)
     
     def _try_wl_copy(self, text: str) -> bool:
         """Try using wl-copy (Wayland clipboard)."""
-        try:
-            process = subprocess.run(
-                ['wl-copy'],
-                input=text,
-                text=True,
-                check=True,
-                capture_output=True
-            )
-            return process.returncode == 0
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return self._pipe_to(['wl-copy'], text)
     
     def _try_termux_clipboard(self, text: str) -> bool:
         """Try using termux-clipboard (for Termux/Android)."""
-        try:
-            process = subprocess.run(
-                ['termux-clipboard-set'],
-                input=text,
-                text=True,
-                check=True,
-                capture_output=True
-            )
-            return process.returncode == 0
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return self._pipe_to(['termux-clipboard-set'], text)
 
 
 class MainWindow:
     """Main window for the bw-tui application."""
     
+    # Help text shown in the status bar for each mode
+    _HELP_BROWSE = "q:quit | s:search | /:search | c:copy | ENTER:copy | ESC:clear search | l:lock"
+    _HELP_SEARCH = "Type to search | ENTER:copy | ESC:clear search | q:quit"
+    _HELP_EMPTY = ""
+    _HELP_TEXT = {"browse": _HELP_BROWSE, "search": _HELP_SEARCH}
+    
+    # Printable ASCII characters by key code, None for everything else
+    _PRINTABLE = tuple(chr(i) if 32 <= i <= 126 else None for i in range(128))
+    
+    # Layout of the unlock screen
+    _UNLOCK_BOX_WIDTH = 50
+    _UNLOCK_BOX_HEIGHT = 8
+    _PASSWORD_PROMPT = "Password:"
+    
+    # Vault size from which full scans are vectorized with numpy, if installed
+    NUMPY_SCAN_THRESHOLD = 500
+    
+    # Spinner shown while the CLI works in the background, and how often
+    # input waits wake up to advance it and check on the work
+    _SPINNER = "|/-\\"
+    BACKGROUND_POLL_MS = 100
+    # How often idle input waits check on work that shows no spinner
+    # (the sync and the reload after it)
+    QUIET_POLL_MS = 1000
+    
+    # Most keys applied between two redraws
+    MAX_KEYS_PER_FRAME = 32
+    
+    # How long status bar messages stay up
+    STATUS_MESSAGE_SECONDS = 3.0
+    
+    # Shortest time between two frames of the main UI (60 Hz)
+    MIN_FRAME_INTERVAL = 1 / 60
+    
     def __init__(self, stdscr, bw_cli: BitwardenCLI):
         """Initialize the main window.
         
@@ -127,15 +190,44 @@ class MainWindow:
         self.logger = logging.getLogger(__name__)
         self.clipboard = ClipboardManager()
         
+        # Slow CLI calls run here so the UI keeps handling keys meanwhile
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._unlock_future: Optional[Future] = None
+        self._load_future: Optional[Future] = None
+        self._sync_future: Optional[Future] = None
+        self._sync_started = False
+        self._lock_future: Optional[Future] = None
+        
         # UI state
         self.items: List[Dict[str, Any]] = []
-        self.filtered_items: List[Dict[str, Any]] = []
         self.current_selection = 0
         self.search_query = ""
+        self._last_query = ""  # Lowercased query behind _last_indices
+        self._last_indices: Tuple[int, ...] = ()
+        self._compute_filter = lru_cache(maxsize=64)(self._filter_indices)
+        self._filter_pending = False  # search_query changed since the last _filter_items
+        self._trigram_index: Dict[str, Set[int]] = {}  # 3-gram -> indices into items
+        self._search_keys: List[str] = []  # Lowercased "name\0username", aligned with items
+        self._char_masks: List[int] = []  # Characters present in each item, see _char_mask
+        self._field_lens: List[int] = []  # Length of each item's longer search field
+        self._search_keys_np = None  # numpy array of _search_keys, see _read_items
+        self._filtered_indices: Sequence[int] = ()  # Indices into items of the listed items
+        self._displays: List[str] = []  # "name (username)" row text, aligned with items
+        self._display_width = 0  # Width the cached row texts were truncated to
+        self._display_cache: Dict[int, str] = {}  # Index into items -> truncated row text
         self.mode = "browse"  # browse, search, unlock
         self.status_message = ""  # Temporary status message
         self.status_color = 0     # Color pair for status message
-        self.status_message_time = 0  # Timestamp when message was set
+        self._status_expires = 0.0  # time.monotonic() after which the message is cleared
+        
+        # Redraw tracking: windows to repaint and single rows of the list
+        self._dirty = {"header": True, "main": True, "status": True}
+        self._dirty_rows: Set[int] = set()
+        self._view_start = 0  # First item index shown in the list
+        self._last_draw = 0.0  # time.monotonic() of the last frame
+        self._draw_deferred = False  # A frame was skipped to respect MIN_FRAME_INTERVAL
+        self._last_count: Tuple[int, int] = (-1, -1)  # (selection, total) behind _last_count_text
+        self._last_count_text = ""
         
         # Window dimensions
         self.height, self.width = stdscr.getmaxyx()
@@ -145,6 +237,9 @@ class MainWindow:
         
         # Create windows
         self._create_windows()
+        
+        # Flush the blank screen once so it never repaints over the windows
+        self.stdscr.refresh()
     
     def _init_curses(self):
         """Initialize curses settings."""
@@ -152,8 +247,7 @@ class MainWindow:
         curses.cbreak()     # Disable line buffering
         curses.noecho()     # Don't echo input
         self.stdscr.keypad(True)  # Enable special keys
-        self.stdscr.nodelay(True)  # Non-blocking input
-        self.stdscr.timeout(50)    # 50ms timeout for better responsiveness
+        self.stdscr.nodelay(False)  # Block while idle instead of polling
         
         # Initialize colors
         curses.start_color()
@@ -161,6 +255,23 @@ class MainWindow:
         curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Success
         curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)    # Error
         curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)   # Info
+        
+        # Look the drawing attributes up once instead of on every draw
+        self._color_pairs = [curses.color_pair(pair) for pair in range(5)]
+        self._attr_selected = self._color_pairs[1]
+        self._attr_bold = curses.A_BOLD
+        self._attr_dim = curses.A_DIM
+        self._attr_reverse = curses.A_REVERSE
+        
+        # Box drawing characters, with a fallback for terminals that don't support ACS
+        try:
+            self._box_chars = (
+                curses.ACS_ULCORNER, curses.ACS_URCORNER,
+                curses.ACS_LLCORNER, curses.ACS_LRCORNER,
+                curses.ACS_HLINE, curses.ACS_VLINE,
+            )
+        except (AttributeError, ValueError):
+            self._box_chars = ('+', '+', '+', '+', '-', '|')
     
     def _create_windows(self):
         """Create the UI windows."""
@@ -175,6 +286,19 @@ class MainWindow:
         # Status window
         self.status_win = curses.newwin(2, self.width, self.height - 2, 0)
     
+    def _resize(self):
+        """Adopt the new terminal size after a resize.
+        
+        Row texts cached in _display_cache are dropped by _draw_rows once
+        it sees the new width.
+        """
+        self.height, self.width = self.stdscr.getmaxyx()
+        self._create_windows()
+        
+        # Repaint the whole terminal, whatever it did with the old contents
+        self.stdscr.clear()
+        self.stdscr.noutrefresh()
+    
     def run(self):
         """Run the main UI loop."""
         self.logger.debug("Starting UI main loop")
@@ -189,17 +313,21 @@ class MainWindow:
         else:
             self.logger.debug("Vault is already unlocked")
         
-        # Load initial items
-        self.logger.debug("Loading initial items...")
-        self._load_items()
+        # Load initial items, unless they were prefetched during unlock
+        if self._load_future is None:
+            self.logger.debug("Loading initial items...")
+            self._load_items()
         
         # Draw initial UI
         self._draw_ui()
         
-        # Main loop - only redraw when there's input
+        # Main loop - only redraw when there's input or background progress
         self.logger.debug("Entering main input loop")
-        while True:
-            self._handle_input()
+        try:
+            while True:
+                self._handle_input()
+        finally:
+            self._executor.shutdown(wait=False)
     
     def _unlock_vault(self) -> bool:
         """Unlock the vault by prompting for password.
@@ -211,64 +339,80 @@ class MainWindow:
         self.mode = "unlock"
         password = ""
         
-        # Disable non-blocking input for password entry
-        self.stdscr.nodelay(False)
-        self.stdscr.timeout(-1)  # Blocking input
+        # Draw initial screen
+        self._draw_unlock_screen(password)
         
-        try:
-            # Draw initial screen
-            self._draw_unlock_screen(password)
-            
-            while True:
-                try:
-                    ch = self.stdscr.getch()
-                    self.logger.debug("Received key code: %d", ch)
-                    
-                    old_password = password
-                    
-                    if ch == curses.KEY_ENTER or ch == 10 or ch == 13:
-                        # Try to unlock
-                        self.logger.debug("Attempting to unlock vault with provided password")
-                        session_key = self.bw_cli.unlock(password)
+        while True:
+            try:
+                ch = self._wait_for_key()
+                self.logger.debug("Received key code: %d", ch)
+                
+                # Keys are ignored while `bw unlock` runs
+                if self._unlock_future is not None:
+                    if ch == curses.KEY_RESIZE:
+                        self._resize()
+                    if self._unlock_future.done():
+                        session_key = self._unlock_future.result()
+                        self._unlock_future = None
                         if session_key:
                             self.logger.debug("Unlock successful")
                             self.mode = "browse"
                             # Session key is now managed by the CLI wrapper
                             return True
-                        else:
-                            # Show error and try again
-                            self.logger.debug("Unlock failed, invalid password")
-                            password = ""
-                            self._show_status("Invalid password. Try again.", error=True)
-                            
-                    elif ch == 27:  # ESC
-                        self.logger.debug("User cancelled unlock process")
-                        return False
-                        
-                    elif ch == curses.KEY_BACKSPACE or ch == 127 or ch == 8:
-                        if password:
-                            password = password[:-1]
-                            self.logger.debug("Backspace pressed, password length now: %d", len(password))
                         
-                    elif ch >= 32 and ch <= 126:  # Printable characters
-                        password += chr(ch)
-                        self.logger.debug("Added character, password length now: %d", len(password))
-                        
-                    # Handle other special keys (ignore them)
-                    elif ch != -1:
-                        self.logger.debug("Ignoring special key: %d", ch)
-                    
-                    # Only redraw if password changed
-                    if password != old_password:
-                        self._draw_unlock_screen(password)
+                        # Show error and try again
+                        self.logger.debug("Unlock failed, invalid password")
+                        self._load_future = None  # The prefetch found the vault locked
+                        password = ""
+                        self._show_status("Invalid password. Try again.", error=True)
+                    self._draw_unlock_screen(password)
+                    continue
+                
+                old_password = password
+                
+                if ch == curses.KEY_ENTER or ch == 10 or ch == 13:
+                    # Try to unlock
+                    self.logger.debug("Attempting to unlock vault with provided password")
+                    self._unlock_future = self._executor.submit(self.bw_cli.unlock, password)
+                    # Queued behind the unlock, so the items start loading the
+                    # moment it succeeds rather than after the next redraw
+                    self._load_future = self._executor.submit(self._prefetch_items, self._unlock_future)
+                
+                elif ch == -1:  # Timed out waiting for a key: the status message expired
+                    self._mark_dirty("status")
+                
+                elif ch == curses.KEY_RESIZE:
+                    self._resize()
+                    self._mark_dirty("status")
                         
-                except (KeyboardInterrupt, EOFError) as e:
-                    self.logger.error("Input handling interrupted: %s", e)
+                elif ch == 27:  # ESC
+                    self.logger.debug("User cancelled unlock process")
                     return False
-        finally:
-            # Re-enable non-blocking input for main interface
-            self.stdscr.nodelay(True)
-            self.stdscr.timeout(50)
+                    
+                elif ch == curses.KEY_BACKSPACE or ch == 127 or ch == 8:
+                    if password:
+                        password = password[:-1]
+                        self.logger.debug("Backspace pressed, password length now: %d", len(password))
+                    
+                elif 0 <= ch < 128 and (char := self._PRINTABLE[ch]) is not None:
+                    password += char
+                    self.logger.debug("Added character, password length now: %d", len(password))
+                    
+                # Handle other special keys (ignore them)
+                elif ch != -1:
+                    self.logger.debug("Ignoring special key: %d", ch)
+                
+                # Only redraw what changed: typing just repaints the field
+                if self._dirty["status"] or self._unlock_future is not None:
+                    self._draw_unlock_screen(password)
+                elif password != old_password:
+                    self._draw_password_field(password)
+                    self.stdscr.noutrefresh()
+                    curses.doupdate()
+                    
+            except (KeyboardInterrupt, EOFError) as e:
+                self.logger.error("Input handling interrupted: %s", e)
+                return False
     
     def _draw_unlock_screen(self, password: str):
         """Draw the unlock screen.
@@ -276,127 +420,299 @@ class MainWindow:
         Args:
             password: Current password input (masked)
         """
-        self.stdscr.clear()
+        self.stdscr.erase()
         
         # Title
         title = "🔐 bw-tui - Unlock Vault"
-        self.stdscr.addstr(2, (self.width - len(title)) // 2, title, curses.A_BOLD)
+        self.stdscr.addstr(2, (self.width - len(title)) // 2, title, self._attr_bold)
         
         # Calculate box dimensions
-        box_width = 50
-        box_height = 8
-        box_x = (self.width - box_width) // 2
-        box_y = (self.height - box_height) // 2
+        box_width = self._UNLOCK_BOX_WIDTH
+        box_height = self._UNLOCK_BOX_HEIGHT
+        box_y, box_x = self._unlock_box_origin()
         
-        # Draw box border (with fallback for terminals that don't support ACS)
-        try:
-            ul_char = curses.ACS_ULCORNER
-            ur_char = curses.ACS_URCORNER
-            ll_char = curses.ACS_LLCORNER
-            lr_char = curses.ACS_LRCORNER
-            h_char = curses.ACS_HLINE
-            v_char = curses.ACS_VLINE
-        except (AttributeError, ValueError):
-            # Fallback to ASCII characters for terminals that don't support ACS
-            ul_char = '+'
-            ur_char = '+'
-            ll_char = '+'
-            lr_char = '+'
-            h_char = '-'
-            v_char = '|'
-        
-        for i in range(box_height):
-            for j in range(box_width):
-                x = box_x + j
-                y = box_y + i
-                
-                if i == 0 and j == 0:
-                    self.stdscr.addch(y, x, ul_char)
-                elif i == 0 and j == box_width - 1:
-                    self.stdscr.addch(y, x, ur_char)
-                elif i == box_height - 1 and j == 0:
-                    self.stdscr.addch(y, x, ll_char)
-                elif i == box_height - 1 and j == box_width - 1:
-                    self.stdscr.addch(y, x, lr_char)
-                elif i == 0 or i == box_height - 1:
-                    self.stdscr.addch(y, x, h_char)
-                elif j == 0 or j == box_width - 1:
-                    self.stdscr.addch(y, x, v_char)
+        # Draw box border, whole edges at a time rather than cell by cell
+        ul_char, ur_char, ll_char, lr_char, h_char, v_char = self._box_chars
+        right_x = box_x + box_width - 1
+        bottom_y = box_y + box_height - 1
+        self.stdscr.hline(box_y, box_x + 1, h_char, box_width - 2)
+        self.stdscr.hline(bottom_y, box_x + 1, h_char, box_width - 2)
+        self.stdscr.vline(box_y + 1, box_x, v_char, box_height - 2)
+        self.stdscr.vline(box_y + 1, right_x, v_char, box_height - 2)
+        self.stdscr.addch(box_y, box_x, ul_char)
+        self.stdscr.addch(box_y, right_x, ur_char)
+        self.stdscr.addch(bottom_y, box_x, ll_char)
+        self.stdscr.addch(bottom_y, right_x, lr_char)
         
         # Box title
         box_title = " Enter Master Password "
         title_x = box_x + (box_width - len(box_title)) // 2
-        self.stdscr.addstr(box_y + 1, title_x, box_title, curses.A_BOLD)
+        self.stdscr.addstr(box_y + 1, title_x, box_title, self._attr_bold)
         
         # Password prompt and input
-        prompt = "Password:"
         prompt_x = box_x + 4
         prompt_y = box_y + 3
-        self.stdscr.addstr(prompt_y, prompt_x, prompt, curses.A_BOLD)
+        self.stdscr.addstr(prompt_y, prompt_x, self._PASSWORD_PROMPT, self._attr_bold)
         
-        # Password input field (with background)
+        self._draw_password_field(password)
+        
+        # Instructions, or progress while `bw unlock` runs
+        if self._unlock_future is not None:
+            instructions = f"Unlocking vault... {self._spinner_frame()}"
+        else:
+            instructions = "ENTER to unlock • ESC to exit"
+        instr_x = box_x + (box_width - len(instructions)) // 2
+        self.stdscr.addstr(box_y + 5, instr_x, instructions, self._attr_dim)
+        
+        self.stdscr.noutrefresh()
+        self._draw_status()
+        self._dirty["status"] = False
+        curses.doupdate()
+    
+    def _unlock_box_origin(self) -> Tuple[int, int]:
+        """Get the screen position of the unlock screen's box.
+        
+        Returns:
+            Tuple of (y, x) of the box's top-left corner
+        """
+        box_y = (self.height - self._UNLOCK_BOX_HEIGHT) // 2
+        box_x = (self.width - self._UNLOCK_BOX_WIDTH) // 2
+        return box_y, box_x
+    
+    def _draw_password_field(self, password: str):
+        """Draw the masked password input field of the unlock screen.
+        
+        Args:
+            password: Current password input (masked)
+        """
+        box_y, box_x = self._unlock_box_origin()
+        prompt_y = box_y + 3
+        input_x = box_x + 4 + len(self._PASSWORD_PROMPT) + 1
         input_width = 30
-        input_x = box_x + 4 + len(prompt) + 1
+        
+        # Password input field (with background)
         input_bg = " " * input_width
-        self.stdscr.addstr(prompt_y, input_x, input_bg, curses.A_REVERSE)
+        self.stdscr.addstr(prompt_y, input_x, input_bg, self._attr_reverse)
         
         # Password mask
-        mask = "*" * len(password)
-        if len(mask) > input_width - 2:
-            mask = mask[:input_width - 2]
-        mask_x = input_x + 1
-        self.stdscr.addstr(prompt_y, mask_x, mask, curses.A_REVERSE | curses.A_BOLD)
-        
-        # Instructions
-        instructions = "ENTER to unlock • ESC to exit"
-        instr_x = box_x + (box_width - len(instructions)) // 2
-        self.stdscr.addstr(box_y + 5, instr_x, instructions, curses.A_DIM)
-        
-        self.stdscr.refresh()
+        mask = "*" * min(len(password), input_width - 2)
+        self.stdscr.addstr(prompt_y, input_x + 1, mask, self._attr_reverse | self._attr_bold)
     
     def _load_items(self):
-        """Load items from the vault."""
+        """Start loading items from the vault in the background.
+        
+        The list shows a spinner until _poll_background installs the
+        result. A reload keeps the current items on screen meanwhile.
+        """
         self.logger.debug("Loading items from vault...")
-        self.items = self.bw_cli.get_items()
-        self.logger.debug("Loaded %d items from vault", len(self.items))
-        self.filtered_items = self.items.copy()
-        self.current_selection = 0
-        self.logger.debug("Filtered items count: %d", len(self.filtered_items))
+        self._load_future = self._executor.submit(self._read_items)
+        self._mark_dirty("main")
+    
+    def _prefetch_items(self, unlock_future: Future) -> Optional[Dict[str, Any]]:
+        """Read the items once the pending unlock has finished. Runs on the
+        worker thread.
         
-        # Log some sample item names for debugging
-        for i, item in enumerate(self.items[:3]):
-            name = item.get("name", "Unknown")
-            self.logger.debug("Item %d: %s", i+1, name)
-
-
+        Args:
+            unlock_future: The pending `bw unlock` call
+            
+        Returns:
+            The result of _read_items, or None if the unlock failed
+        """
+        if not unlock_future.result():
+            return None
+        return self._read_items()
+    
+    def _read_items(self) -> Dict[str, Any]:
+        """Read and index the vault items. Runs on the worker thread.
+        
+        Items are indexed for searching and display in the same pass that
+        reads them from the CLI. Nothing is stored on the window, so the
+        UI thread can keep using the current items meanwhile.
+        
+        Returns:
+            The items and their search and display data, for _install_items
+        """
+        items: List[Dict[str, Any]] = []
+        # Searchable fields are lowercased once, into a plain list aligned
+        # with items so searches never touch the item dicts. Typed queries
+        # never contain the NUL separator, so a match can't span both fields.
+        search_keys: List[str] = []
+        field_lens: List[int] = []
+        char_masks: List[int] = []
+        displays: List[str] = []  # Row text for the list, truncated lazily in _draw_rows
+        trigram_index: Dict[str, Set[int]] = {}
+        log_samples = self.logger.isEnabledFor(logging.DEBUG)
+        
+        for idx, item in enumerate(self.bw_cli.iter_items()):
+            if log_samples and idx < 3:
+                self.logger.debug("Item %d: %s", idx + 1, item.get("name", "Unknown"))
+            
+            login = item.get("login") or {}
+            name = (item.get("name") or "").lower()
+            username = (login.get("username") or "").lower()
+            
+            items.append(item)
+            search_keys.append(f"{name}\0{username}")
+            field_lens.append(max(len(name), len(username)))
+            char_masks.append(self._char_mask(name + username))
+            
+            display_username = f" ({login['username']})" if login.get("username") else ""
+            displays.append(f"{item.get('name', 'Unknown')}{display_username}")
+            
+            # Index each field separately: a match never spans both
+            for field in (name, username):
+                for trigram in self._trigrams(field):
+                    trigram_index.setdefault(trigram, set()).add(idx)
+        
+        self.logger.debug("Loaded %d items from vault", len(items))
+        
+        # Large vaults are scanned in C rather than item by item
+        search_keys_np = None
+        if np is not None and len(items) >= self.NUMPY_SCAN_THRESHOLD:
+            search_keys_np = np.array(search_keys, dtype=str)
+        
+        return {
+            # A locked vault reads as empty: tell it apart from an empty vault
+            "locked": not items and not self.bw_cli.is_unlocked(),
+            "items": items,
+            "search_keys": search_keys,
+            "field_lens": field_lens,
+            "char_masks": char_masks,
+            "displays": displays,
+            "trigram_index": trigram_index,
+            "search_keys_np": search_keys_np,
+        }
+    
+    def _install_items(self, loaded: Dict[str, Any]):
+        """Replace the items with a freshly read set.
+        
+        The selected item stays selected if it is still in the results.
+        
+        Args:
+            loaded: Result of _read_items
+        """
+        selected_id = None
+        if self.current_selection < len(self._filtered_indices):
+            selected_id = self.items[self._filtered_indices[self.current_selection]].get("id")
+        
+        self.items = loaded["items"]
+        self._search_keys = loaded["search_keys"]
+        self._field_lens = loaded["field_lens"]
+        self._char_masks = loaded["char_masks"]
+        self._displays = loaded["displays"]
+        self._trigram_index = loaded["trigram_index"]
+        self._search_keys_np = loaded["search_keys_np"]
+        
+        self._display_cache = {}
+        self._last_query = ""
+        self._last_indices = ()
+        self._compute_filter = lru_cache(maxsize=64)(self._filter_indices)  # Drop results for the old items
+        self._filtered_indices = ()  # Old positions mean nothing in the new items
+        self._filter_items()  # Apply whatever was typed while loading
+        if selected_id is not None:
+            items = self.items
+            for position, idx in enumerate(self._filtered_indices):
+                if items[idx].get("id") == selected_id:
+                    self.current_selection = position
+                    break
+        self._mark_dirty("header")
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Get every 3-character substring of a string.
+        
+        Args:
+            text: String to split
+            
+        Returns:
+            Set of 3-grams, empty if the string is shorter than 3 characters
+        """
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _char_mask(text: str) -> int:
+        """Get a bitmask of the characters present in a string.
+        
+        Each character sets bit (code point mod 256). Characters can share
+        a bit, so a mask only proves a character is absent, never present.
+        
+        Args:
+            text: String to summarize
+            
+        Returns:
+            256-bit mask as an int
+        """
+        mask = 0
+        for char in set(text):
+            mask |= 1 << (ord(char) & 0xFF)
+        return mask
+    
+    def _mark_dirty(self, *windows: str):
+        """Mark windows as needing a redraw.
+        
+        Args:
+            windows: Names of windows to redraw ("header", "main", "status")
+        """
+        for window in windows:
+            self._dirty[window] = True
+    
     def _draw_ui(self):
-        """Draw the main UI."""
-        self._draw_header()
-        self._draw_items()
-        self._draw_status()
+        """Draw the parts of the main UI that changed.
         
-        self.stdscr.refresh()
+        Frames are at least MIN_FRAME_INTERVAL apart. A frame asked for
+        sooner is deferred: the windows stay dirty and the input loop
+        wakes up to draw them once the interval has passed.
+        """
+        now = time.monotonic()
+        if now - self._last_draw < self.MIN_FRAME_INTERVAL:
+            self._draw_deferred = True
+            return
+        self._draw_deferred = False
+        self._last_draw = now
+        
+        if self._dirty["header"]:
+            self._draw_header()
+        if self._dirty["main"]:
+            self._draw_items()
+        elif self._dirty_rows:
+            self._draw_rows(self._dirty_rows)
+            self.main_win.noutrefresh()
+        if self._dirty["status"]:
+            self._draw_status()
+        
+        self._dirty = dict.fromkeys(self._dirty, False)
+        self._dirty_rows = set()
+        
+        # Flush every window to the terminal in a single pass
+        curses.doupdate()
     
     def _draw_header(self):
         """Draw the header window."""
-        self.header_win.clear()
+        self.header_win.erase()
         self.header_win.box()
         
         title = "bw-tui - Bitwarden Terminal Interface"
-        self.header_win.addstr(1, 2, title, curses.A_BOLD)
+        self.header_win.addstr(1, 2, title, self._attr_bold)
         
         if self.mode == "search":
             search_text = f"Search: {self.search_query}"
             self.header_win.addstr(1, self.width - len(search_text) - 2, search_text)
         
-        self.header_win.refresh()
+        self.header_win.noutrefresh()
     
     def _draw_items(self):
         """Draw the items list."""
-        self.main_win.clear()
+        self.main_win.erase()
         self.main_win.box()
         
-        if not self.filtered_items:
+        if self._load_future is not None and not self.items:
+            msg = f"Loading items... {self._spinner_frame()}"
+            self.main_win.addstr(
+                (self.height - 5) // 2, 
+                (self.width - len(msg)) // 2, 
+                msg
+            )
+        elif not self._filtered_indices:
             msg = "No items found" if self.search_query else "No items in vault"
             self.main_win.addstr(
                 (self.height - 5) // 2, 
@@ -404,170 +720,459 @@ class MainWindow:
                 msg
             )
         else:
-            max_items = self.height - 7  # Account for borders and padding
-            start_idx = max(0, self.current_selection - max_items // 2)
-            end_idx = min(len(self.filtered_items), start_idx + max_items)
+            start_idx, end_idx = self._visible_range(self.current_selection)
+            self._view_start = start_idx
             
-            for i, item in enumerate(self.filtered_items[start_idx:end_idx]):
-                y = i + 1
-                item_idx = start_idx + i
-                
-                # Format item display
-                name = item.get("name", "Unknown")
-                username = ""
-                if item.get("login") and item["login"].get("username"):
-                    username = f" ({item['login']['username']})"
-                
-                display_text = f"{name}{username}"
+            self._draw_rows(range(start_idx, end_idx))
+        
+        self.main_win.noutrefresh()
+    
+    def _visible_range(self, selection: int) -> Tuple[int, int]:
+        """Get the range of item indices shown for a given selection.
+        
+        Args:
+            selection: Index of the selected item
+            
+        Returns:
+            Tuple of (first visible index, one past the last visible index)
+        """
+        max_items = self.height - 7  # Account for borders and padding
+        start_idx = max(0, selection - max_items // 2)
+        end_idx = min(len(self._filtered_indices), start_idx + max_items)
+        return start_idx, end_idx
+    
+    def _draw_rows(self, item_indices: Iterable[int]):
+        """Draw the given rows of the currently visible page.
+        
+        Args:
+            item_indices: Indices into _filtered_indices of the rows to draw
+        """
+        addstr = self.main_win.addstr
+        view_start = self._view_start
+        max_width = self.width - 4
+        selected = self.current_selection
+        selected_attrs = self._attr_selected
+        
+        # Cached texts are truncated for one width only
+        if max_width != self._display_width:
+            self._display_width = max_width
+            self._display_cache = {}
+        cache = self._display_cache
+        
+        for item_idx in item_indices:
+            idx = self._filtered_indices[item_idx]
+            display_text = cache.get(idx)
+            if display_text is None:
+                display_text = self._displays[idx]
                 
                 # Truncate if too long
-                max_width = self.width - 4
                 if len(display_text) > max_width:
                     display_text = display_text[:max_width - 3] + "..."
-                
-                # Highlight selected item
-                attrs = curses.color_pair(1) if item_idx == self.current_selection else 0
-                
-                self.main_win.addstr(y, 2, display_text, attrs)
+                cache[idx] = display_text
+            
+            # Highlight selected item
+            attrs = selected_attrs if item_idx == selected else 0
+            
+            addstr(item_idx - view_start + 1, 2, display_text, attrs)
+    
+    def _move_selection(self, selection: int):
+        """Move the selection, redrawing as little of the list as possible.
         
-        self.main_win.refresh()
+        Args:
+            selection: Index of the newly selected item
+        """
+        previous = self.current_selection
+        self.current_selection = selection
+        
+        # Within the same page only the old and new rows change
+        if self._visible_range(selection)[0] == self._view_start:
+            self._dirty_rows.update((previous, selection))
+        else:
+            self._mark_dirty("main")
+        self._mark_dirty("status")
     
     def _draw_status(self):
         """Draw the status window."""
-        # Clear expired status messages (after 3 seconds)
-        if self.status_message and time.time() - self.status_message_time > 3:
+        # Clear expired status messages
+        if self.status_message and time.monotonic() >= self._status_expires:
             self.status_message = ""
             self.status_color = 0
-            self.status_message_time = 0
         
-        self.status_win.clear()
+        self.status_win.erase()
         
         # Show status message if present
         if self.status_message:
             try:
-                self.status_win.addstr(0, 0, self.status_message, curses.color_pair(self.status_color))
+                self.status_win.addstr(0, 0, self.status_message, self._color_pairs[self.status_color])
             except curses.error:
                 # Handle case where message is too long
                 pass
         else:
             # Show help text
-            if self.mode == "browse":
-                help_text = "q:quit | s:search | /:search | c:copy | ENTER:copy | ESC:clear search | l:lock"
-            elif self.mode == "search":
-                help_text = "Type to search | ENTER:copy | ESC:clear search | q:quit"
-            else:
-                help_text = ""
-            
-            self.status_win.addstr(0, 0, help_text)
+            help_text = self._HELP_TEXT.get(self.mode, self._HELP_EMPTY)
+            self.status_win.addnstr(0, 0, help_text, self.width)  # Cut, don't wrap, on narrow terminals
         
-        # Show item count
-        if self.filtered_items:
-            count_text = f"Item {self.current_selection + 1} of {len(self.filtered_items)}"
-            self.status_win.addstr(1, 0, count_text)
+        # Show item count, formatting it only when it changed
+        if self._filtered_indices:
+            count = (self.current_selection, len(self._filtered_indices))
+            if count != self._last_count:
+                self._last_count = count
+                self._last_count_text = f"Item {count[0] + 1} of {count[1]}"
+            self.status_win.addstr(1, 0, self._last_count_text)
         
-        self.status_win.refresh()
+        self.status_win.noutrefresh()
     
     def _show_status(self, message: str, error: bool = False):
-        """Show a status message.
+        """Show a status message for STATUS_MESSAGE_SECONDS.
+        
+        The message is drawn by the next status redraw and cleared once it
+        expires, without blocking input in the meantime. Repeating the
+        message that is already shown does not redraw the status window.
         
         Args:
             message: Message to display
             error: True if this is an error message
         """
-        self.status_win.clear()
-        color = curses.color_pair(3) if error else curses.color_pair(2)
-        self.status_win.addstr(0, 0, message, color)
-        self.status_win.refresh()
-        curses.napms(2000)  # Show for 2 seconds
+        color = 3 if error else 2  # Red or green
+        self._status_expires = time.monotonic() + self.STATUS_MESSAGE_SECONDS
+        if message == self.status_message and color == self.status_color:
+            return  # Already on screen, a repeat only extends it
+        
+        self.status_message = message
+        self.status_color = color
+        self._mark_dirty("status")
+    
+    def _wait_for_key(self) -> int:
+        """Wait for a key press.
+        
+        Blocks until a key arrives, until the current status message
+        expires so it can be cleared, until it is time to check on
+        background work again, or until a deferred frame can be drawn.
+        
+        Returns:
+            Key code returned by getch(), -1 if the wait timed out
+        """
+        now = time.monotonic()
+        deadlines = []
+        if self.status_message:
+            deadlines.append(self._status_expires)
+        if self._background_busy():
+            deadlines.append(now + self.BACKGROUND_POLL_MS / 1000)
+        elif self._sync_future is not None or self._load_future is not None:
+            deadlines.append(now + self.QUIET_POLL_MS / 1000)
+        if self._draw_deferred:
+            deadlines.append(self._last_draw + self.MIN_FRAME_INTERVAL)
+        
+        if deadlines:
+            self.stdscr.timeout(max(0, int((min(deadlines) - now) * 1000) + 1))
+        else:
+            self.stdscr.timeout(-1)
+        return self.stdscr.getch()
+    
+    def _background_busy(self) -> bool:
+        """Check whether a CLI call shown with a spinner or progress message
+        is still outstanding."""
+        return (
+            self._unlock_future is not None
+            or self._lock_future is not None
+            or (self._load_future is not None and not self.items)
+        )
+    
+    def _spinner_frame(self) -> str:
+        """Get the spinner character for the current moment."""
+        frame = int(time.monotonic() * 1000) // self.BACKGROUND_POLL_MS
+        return self._SPINNER[frame % len(self._SPINNER)]
+    
+    def _unlock_again(self):
+        """Ask for the master password again after a load found the vault
+        locked, e.g. by `bw lock` in another terminal.
+        
+        Raises:
+            KeyboardInterrupt: If the user cancels the unlock, to exit
+        """
+        self.logger.debug("Vault was locked, requesting unlock")
+        self._show_status("Vault is locked. Enter your master password.", error=True)
+        if not self._unlock_vault():
+            raise KeyboardInterrupt
+        
+        self.search_query = ""
+        if self._load_future is None:
+            self._load_items()
+        self._mark_dirty("header", "main", "status")
+    
+    def _start_sync(self):
+        """Sync the vault in the background.
+        
+        The sync runs on a daemon thread rather than the executor, whose
+        worker is joined at exit: quitting must not wait for `bw sync`.
+        """
+        future: Future = Future()
+        
+        def sync():
+            try:
+                future.set_result(self.bw_cli.sync())
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=sync, daemon=True).start()
+        self._sync_future = future
+    
+    def _poll_background(self) -> bool:
+        """Pick up finished background work, expired status messages and
+        deferred frames.
+        
+        Returns:
+            True if the UI needs to be redrawn, False otherwise
+        """
+        redraw_needed = self._draw_deferred
+        
+        if self._load_future is not None:
+            if self._load_future.done():
+                loaded = self._load_future.result()
+                self._load_future = None
+                self._install_items(loaded)
+                if loaded["locked"]:
+                    self._unlock_again()
+                elif not self._sync_started:
+                    # Sync once the local copy is on screen, then show the synced items
+                    self._sync_started = True
+                    self._start_sync()
+                redraw_needed = True
+            elif not self.items:
+                self._mark_dirty("main")  # Advance the spinner
+                redraw_needed = True
+        
+        if self._sync_future is not None and self._sync_future.done():
+            synced = self._sync_future.result()
+            self._sync_future = None
+            if synced:
+                self.logger.debug("Vault synced, reloading items")
+                self._load_items()
+        
+        if self._lock_future is not None and self._lock_future.done():
+            locked = self._lock_future.result()
+            self._lock_future = None
+            if locked:
+                self.logger.debug("Vault locked successfully")
+                self._show_status("Vault locked successfully - exiting")
+                # Exit after successful lock
+                raise KeyboardInterrupt
+            self.logger.error("Failed to lock vault")
+            self._show_status("Failed to lock vault", error=True)
+            redraw_needed = True
+        
+        if self.status_message and time.monotonic() >= self._status_expires:
+            # The status message expired, redraw it without one
+            self._mark_dirty("status")
+            redraw_needed = True
+        
+        return redraw_needed
     
     def _handle_input(self):
-        """Handle keyboard input."""
-        ch = self.stdscr.getch()
+        """Handle keyboard input.
         
-        # With nodelay enabled, getch() returns -1 if no input available
+        Blocks until a key arrives, then applies the keys that are already
+        waiting (up to MAX_KEYS_PER_FRAME) before redrawing, so a paste or
+        key repeat costs one redraw. Search edits in the batch are filtered
+        once, for the final query.
+        """
+        ch = self._wait_for_key()
+        
+        redraw_needed = self._poll_background()
         if ch == -1:
-            return  # No input available, nothing to do
+            if redraw_needed:
+                self._draw_ui()
+            return
+        
+        redraw_needed = self._process_key(ch) or redraw_needed
+        
+        # Drain the rest of this burst without blocking, but leave keys
+        # beyond MAX_KEYS_PER_FRAME for the next frame so a paste flood
+        # can't hold off the redraw
+        self.stdscr.nodelay(True)
+        try:
+            for _ in range(self.MAX_KEYS_PER_FRAME - 1):
+                ch = self.stdscr.getch()
+                if ch == -1:
+                    break
+                redraw_needed = self._process_key(ch) or redraw_needed
+        finally:
+            self.stdscr.nodelay(False)
+        
+        self._flush_filter()
+        
+        # Only redraw if something changed
+        if redraw_needed:
+            self._draw_ui()
+    
+    def _process_key(self, ch: int) -> bool:
+        """Apply a single key press to the UI state.
         
+        Args:
+            ch: Key code returned by getch()
+            
+        Returns:
+            True if the UI needs to be redrawn, False otherwise
+        """
         redraw_needed = True  # Track if we need to redraw
         
         if ch == ord('q') and self.mode != "search":  # Quit only if not in search mode
             raise KeyboardInterrupt
         
         elif ch == 27:  # ESC - Clear search
+            if not self.search_query and self.mode == "browse":
+                return False  # Already cleared
             self.search_query = ""
             self.mode = "browse"
             self._filter_items()
+            self._mark_dirty("header")
         
         elif ch == ord('s') or ch == ord('/'):  # Start search
             self.mode = "search"
+            self._mark_dirty("header", "status")
         
         elif ch == ord('c') or ch == curses.KEY_ENTER or ch == 10:  # Copy password
+            self._flush_filter()
             self._copy_password()
+            redraw_needed = self._dirty["status"]  # A repeated message changes nothing
         
         elif ch == ord('l'):  # Lock vault
+            if self._lock_future is not None:
+                return False  # Already locking
             self.logger.debug("Locking vault via UI command")
-            if self.bw_cli.lock():
-                self.logger.debug("Vault locked successfully")
-                self.status_message = "Vault locked successfully - exiting"
-                self.status_color = 2  # Green
-                self.status_message_time = time.time()
-                # Exit after successful lock
-                raise KeyboardInterrupt
-            else:
-                self.logger.error("Failed to lock vault")
-                self.status_message = "Failed to lock vault"
-                self.status_color = 3  # Red
-                self.status_message_time = time.time()
+            self._lock_future = self._executor.submit(self.bw_cli.lock)
+            self._show_status("Locking vault...")
+        
+        elif ch == curses.KEY_RESIZE:
+            self._resize()
+            self._mark_dirty("header", "main", "status")
         
         elif ch == curses.KEY_UP:
-            if self.filtered_items:
-                self.current_selection = max(0, self.current_selection - 1)
+            self._flush_filter()
+            selection = max(0, self.current_selection - 1)
+            redraw_needed = selection != self.current_selection
+            if redraw_needed:
+                self._move_selection(selection)
         
         elif ch == curses.KEY_DOWN:
-            if self.filtered_items:
-                self.current_selection = min(
-                    len(self.filtered_items) - 1, 
-                    self.current_selection + 1
-                )
+            self._flush_filter()
+            selection = min(
+                len(self._filtered_indices) - 1, 
+                self.current_selection + 1
+            )
+            redraw_needed = selection > self.current_selection
+            if redraw_needed:
+                self._move_selection(selection)
         
         elif self.mode == "search":
+            # The list is filtered once the burst of keys has been applied
             if ch == curses.KEY_BACKSPACE or ch == 127:
                 self.search_query = self.search_query[:-1]
-                self._filter_items()
-            elif ch >= 32 and ch <= 126:  # Printable characters (includes 'q')
-                self.search_query += chr(ch)
-                self._filter_items()
+                self._filter_pending = True
+                self._mark_dirty("header")
+            elif 0 <= ch < 128 and (char := self._PRINTABLE[ch]) is not None:  # Includes 'q'
+                self.search_query += char
+                self._filter_pending = True
+                self._mark_dirty("header")
         else:
             redraw_needed = False  # No state change, no need to redraw
         
-        # Only redraw if something changed
-        if redraw_needed:
-            self._draw_ui()
+        return redraw_needed
+    
+    def _flush_filter(self):
+        """Filter the items if the search query changed since the last filter."""
+        if self._filter_pending:
+            self._filter_items()
     
     def _filter_items(self):
-        """Filter items based on search query."""
+        """Filter items based on search query.
+        
+        The selected item stays selected if it still matches, otherwise the
+        selection goes back to the first match.
+        """
+        self._filter_pending = False
+        selected_idx = None
+        if self.current_selection < len(self._filtered_indices):
+            selected_idx = self._filtered_indices[self.current_selection]
+        
         if not self.search_query:
-            self.filtered_items = self.items.copy()
+            self._filtered_indices = range(len(self.items))
+            query_lower = ""
+            indices: Tuple[int, ...] = ()
         else:
+            # Only indices are kept: rows look up the items they draw
             query_lower = self.search_query.lower()
-            self.filtered_items = [
-                item for item in self.items
-                if (item.get("name", "") or "").lower().find(query_lower) != -1 or
-                    (item.get("login") and 
-                     (item["login"].get("username") or "").lower().find(query_lower) != -1)
-            ]
+            indices = self._compute_filter(query_lower)
+            self._filtered_indices = indices
         
+        self._last_query = query_lower
+        self._last_indices = indices
+        
+        # Results are in item order, so the old selection can be bisected
         self.current_selection = 0
+        if selected_idx is not None:
+            position = bisect_left(self._filtered_indices, selected_idx)
+            if position < len(self._filtered_indices) and self._filtered_indices[position] == selected_idx:
+                self.current_selection = position
+        self._mark_dirty("main", "status")
+    
+    def _filter_indices(self, query_lower: str) -> Tuple[int, ...]:
+        """Find the items matching a query.
+        
+        Called through the _compute_filter cache, which is reset whenever
+        the items are reloaded.
+        
+        Args:
+            query_lower: Non-empty lowercased search query
+            
+        Returns:
+            Indices into items of the matching items, in order
+        """
+        if self._last_query and query_lower.startswith(self._last_query):
+            # Extending the previous query can only narrow its matches, so
+            # each keystroke only rescans what the last one kept
+            candidates = self._last_indices
+        elif len(query_lower) >= 3:
+            # Only items containing every 3-gram of the query can match
+            postings = sorted(
+                (self._trigram_index.get(trigram, set()) for trigram in self._trigrams(query_lower)),
+                key=len
+            )
+            candidates = sorted(set.intersection(*postings))
+        elif self._search_keys_np is not None:
+            mask = np.char.find(self._search_keys_np, query_lower) != -1
+            return tuple(np.flatnonzero(mask).tolist())
+        else:
+            candidates = None
+        
+        # Items with both fields shorter than the query, or missing any of
+        # its characters, are rejected before the substring search
+        query_len = len(query_lower)
+        query_mask = self._char_mask(query_lower)
+        lens, masks = self._field_lens, self._char_masks
+        keys = self._search_keys
+        
+        if candidates is None:
+            return tuple(
+                i for i, (length, mask, key) in enumerate(zip(lens, masks, keys))
+                if length >= query_len and mask & query_mask == query_mask and query_lower in key
+            )
+        return tuple(
+            i for i in candidates
+            if lens[i] >= query_len and masks[i] & query_mask == query_mask and query_lower in keys[i]
+        )
     
     def _copy_password(self):
         """Copy the selected item's password to clipboard."""
-        if not self.filtered_items or self.current_selection >= len(self.filtered_items):
+        if not self._filtered_indices or self.current_selection >= len(self._filtered_indices):
             return
         
-        item = self.filtered_items[self.current_selection]
+        item = self.items[self._filtered_indices[self.current_selection]]
+        
+        login = item.get("login") or {}
+        password = login.get("password")
         
-        if item.get("login") and item["login"].get("password"):
-            password = item["login"]["password"]
+        if password:
             if self.clipboard.copy_to_clipboard(password):
                 self._show_status("Password copied for: %s" % item.get('name', 'Unknown'))
             else: